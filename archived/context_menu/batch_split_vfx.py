@@ -4,7 +4,6 @@ import re
 import shutil
 import tempfile
 from pathlib import Path
-from copy import deepcopy
 
 # Setup Project Paths
 current_dir = Path(__file__).parent.absolute()
@@ -45,74 +44,103 @@ H_VFX_CHILD_IDENTIFIER   = h('VfxChildIdentifier')
 H_VFX_EMITTER_DEF        = h('VfxEmitterDefinitionData')
 H_VALUE_FLOAT            = h('ValueFloat')
 
+# Champion/skin prefix stripped from system short names
+_SHORT_PREFIX_RE = re.compile(r'^[A-Za-z]+_(?:Base_|Skin\d+_)')
+
+
+# ── Cloning ──────────────────────────────────────────────────────────────────
+
+def _clone_field(value):
+    """
+    Structural copy of a BINField tree (fields, lists, maps).
+    Leaf values (str, int, float, Vector, ...) are shared, they are never mutated here.
+    """
+    if isinstance(value, BINField):
+        f = BINField.__new__(BINField)
+        f.hash = value.hash
+        f.type = value.type
+        f.hash_type = value.hash_type
+        f.key_type = value.key_type
+        f.value_type = value.value_type
+        f.data = _clone_field(value.data)
+        return f
+    if isinstance(value, list):
+        return [_clone_field(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _clone_field(v) for k, v in value.items()}
+    return value
+
 
 # ── Building blocks ──────────────────────────────────────────────────────────
 
+def _mk(hash, type, data, hash_type=None, value_type=None) -> BINField:
+    """Allocate a BINField without going through BINField.__init__."""
+    f = BINField.__new__(BINField)
+    f.hash = hash
+    f.type = type
+    f.hash_type = hash_type
+    f.key_type = None
+    f.value_type = value_type
+    f.data = data
+    return f
+
+
 def make_trigger_emitter(trigger_name: str, emitter_name_original: str, count: int) -> BINField:
     """
     Build a trigger emitter (POINTER to VfxEmitterDefinitionData).
     """
     effect_link_hash = h(trigger_name)
 
-    child_identifier = BINField(
-        hash=None,
-        type=BINType.EMBED,
+    child_identifier = _mk(
+        None, BINType.EMBED,
+        [_mk(H_EFFECT, BINType.LINK, effect_link_hash)],
         hash_type=H_VFX_CHILD_IDENTIFIER,
-        data=[
-            BINField(hash=H_EFFECT, type=BINType.LINK, data=effect_link_hash),
-        ]
     )
 
-    children_identifiers = BINField(
-        hash=H_CHILDREN_IDENTIFIERS,
-        type=BINType.LIST,
+    children_identifiers = _mk(
+        H_CHILDREN_IDENTIFIERS, BINType.LIST,
+        [child_identifier],
         value_type=BINType.EMBED,
-        data=[child_identifier]
     )
 
-    child_particle_set = BINField(
-        hash=H_CHILD_PARTICLE_SET_DEF,
-        type=BINType.POINTER,
+    child_particle_set = _mk(
+        H_CHILD_PARTICLE_SET_DEF, BINType.POINTER,
+        [children_identifiers],
         hash_type=H_VFX_CHILD_PARTICLE_SET,
-        data=[children_identifiers]
     )
 
-    is_single = BINField(hash=H_IS_SINGLE_PARTICLE, type=BINType.FLAG, data=1)
+    is_single = _mk(H_IS_SINGLE_PARTICLE, BINType.FLAG, 1)
 
-    bind_weight = BINField(
-        hash=H_BIND_WEIGHT,
-        type=BINType.EMBED,
+    bind_weight = _mk(
+        H_BIND_WEIGHT, BINType.EMBED,
+        [_mk(H_CONSTANT_VALUE, BINType.F32, 1.0)],
         hash_type=H_VALUE_FLOAT,
-        data=[BINField(hash=H_CONSTANT_VALUE, type=BINType.F32, data=1.0)]
     )
 
-    local_orient = BINField(hash=H_PARTICLE_IS_LOCAL, type=BINType.FLAG, data=1)
+    local_orient = _mk(H_PARTICLE_IS_LOCAL, BINType.FLAG, 1)
 
-    rate = BINField(
-        hash=H_RATE,
-        type=BINType.EMBED,
+    rate = _mk(
+        H_RATE, BINType.EMBED,
+        [_mk(H_CONSTANT_VALUE, BINType.F32, 1.0)],
         hash_type=H_VALUE_FLOAT,
-        data=[BINField(hash=H_CONSTANT_VALUE, type=BINType.F32, data=1.0)]
     )
 
-    trigger_emitter_name = BINField(
-        hash=H_EMITTER_NAME,
-        type=BINType.STRING,
-        data=f"Trigger_{count}_{emitter_name_original}"
+    trigger_emitter_name = _mk(
+        H_EMITTER_NAME, BINType.STRING,
+        f"Trigger_{count}_{emitter_name_original}"
     )
 
-    trigger_emitter = BINField(
-        hash=None,
-        type=BINType.POINTER,
-        hash_type=H_VFX_EMITTER_DEF,
-        data=[
+    trigger_emitter = _mk(
+        None, BINType.POINTER,
+        [
             is_single,
             child_particle_set,
             bind_weight,
             local_orient,
             rate,
             trigger_emitter_name,
-        ]
+        ],
+        hash_type=H_VFX_EMITTER_DEF,
     )
 
     return trigger_emitter
@@ -152,31 +180,36 @@ def make_wrapper_system(trigger_name: str, original_emitter: BINField) -> BINEnt
 
 # ── Extraction helpers ───────────────────────────────────────────────────────
 
+def _index(entry_or_field) -> dict:
+    """Build a {field.hash: field} lookup over an entry's (or embed's) fields."""
+    return {f.hash: f for f in entry_or_field.data}
+
+
 def get_emitter_name(emitter_pointer: BINField) -> str:
     """Extract the emitterName string from a VfxEmitterDefinitionData pointer."""
     if emitter_pointer.data is None:
         return None
+    # Single lookup: an early-exit scan beats building a field index
     for field in emitter_pointer.data:
         if field.hash == H_EMITTER_NAME and field.type == BINType.STRING:
             return field.data
     return None
 
 
-def get_system_short_name(entry: BINEntry) -> str:
-    """Get a short name from the VfxSystem."""
+def get_system_short_name(entry: BINEntry, fields: dict) -> str:
+    """Get a short name from the VfxSystem, given its field index."""
     name = None
-    for field in entry.data:
-        if field.hash == H_PARTICLE_NAME and field.type == BINType.STRING:
+    for field_hash in (H_PARTICLE_NAME, H_PARTICLE_PATH):
+        field = fields.get(field_hash)
+        if field is not None and field.type == BINType.STRING:
             name = field.data
             break
-        if field.hash == H_PARTICLE_PATH and field.type == BINType.STRING:
-            name = field.data
 
     if not name:
         return entry.hash[:8]
 
     short = name.split('/')[-1] if '/' in name else name
-    short = re.sub(r'^[A-Za-z]+_(Base_|Skin\d+_)', '', short)
+    short = _SHORT_PREFIX_RE.sub('', short, count=1)
 
     if len(short) > 25:
         short = short[:25]
@@ -184,12 +217,17 @@ def get_system_short_name(entry: BINEntry) -> str:
     return short
 
 
-def get_emitter_list_field(entry: BINEntry) -> BINField:
-    """Get the complexEmitterDefinitionData field."""
-    for field in entry.data:
-        if field.hash == H_COMPLEX_EMITTER_DATA:
-            return field
-    return None
+def get_emitter_list_field(fields: dict) -> BINField:
+    """Get the complexEmitterDefinitionData field from a VfxSystem's field index."""
+    return fields.get(H_COMPLEX_EMITTER_DATA)
+
+
+# ── Backups ──────────────────────────────────────────────────────────────────
+
+def _backup_copy(src: Path, dst: Path):
+    """copy2 equivalent that goes straight to copyfile's sendfile/CopyFileW fast path."""
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
 
 
 # ── Main logic ───────────────────────────────────────────────────────────────
@@ -224,12 +262,12 @@ def batch_split_vfx():
         # 1. Backup to Temp Folder
         temp_dir = Path(tempfile.gettempdir())
         temp_backup_path = temp_dir / f"{bin_path.stem}_quartz_temp_{os.getpid()}.bin"
-        shutil.copy2(bin_path, temp_backup_path)
+        _backup_copy(bin_path, temp_backup_path)
         print(f"[BACKUP] Safety copy created in Temp: {temp_backup_path}")
 
         # 2. Local Backup with _backup suffix
         local_backup_path = bin_path.parent / f"{bin_path.stem}_backup.bin"
-        shutil.copy2(bin_path, local_backup_path)
+        _backup_copy(bin_path, local_backup_path)
         print(f"[BACKUP] Local copy created: {local_backup_path.name}")
     except Exception as e:
         print(f"\n[ERROR] Failed to create backups: {e}")
@@ -257,8 +295,9 @@ def batch_split_vfx():
     total_emitters = 0
 
     for sys_entry in vfx_entries:
-        short_name = get_system_short_name(sys_entry)
-        emitter_field = get_emitter_list_field(sys_entry)
+        fields = _index(sys_entry)
+        short_name = get_system_short_name(sys_entry, fields)
+        emitter_field = get_emitter_list_field(fields)
 
         if not emitter_field or not emitter_field.data:
             continue
@@ -271,7 +310,7 @@ def batch_split_vfx():
             trigger = make_trigger_emitter(trigger_name, emitter_name, idx + 1)
             triggers.append(trigger)
 
-            wrapper = make_wrapper_system(trigger_name, deepcopy(original_emitter))
+            wrapper = make_wrapper_system(trigger_name, _clone_field(original_emitter))
             new_entries.append(wrapper)
             total_emitters += 1
 
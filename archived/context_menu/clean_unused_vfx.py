@@ -15,6 +15,7 @@ if str(project_root / 'context_menu') not in sys.path:
 try:
     import pyRitoFile
     from pyRitoFile.bin import BIN
+    from pyRitoFile.helper import normalize_path
 except ImportError:
     print("Error: Could not import pyRitoFile.")
     sys.exit(1)
@@ -40,12 +41,14 @@ def clean_unused_vfx():
             hf_path = hashes_path / hf_name
             if hf_path.exists():
                 try:
-                    with open(hf_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    # Stream through a 256 KiB buffer; only one line is alive at a time
+                    with open(hf_path, 'r', encoding='utf-8', errors='ignore', buffering=262144) as f:
                         count = 0
                         for line in f:
-                            parts = line.strip().split(' ', 1)
-                            if len(parts) == 2:
-                                hashtables[parts[0].lower()] = parts[1].lower()
+                            line = line.strip()
+                            if ' ' in line:
+                                k, v = line.lower().split(' ', 1)
+                                hashtables[k] = v
                                 count += 1
                         print(f"  Loaded {count} hashes from {hf_name}")
                 except Exception as e:
@@ -64,45 +67,34 @@ def clean_unused_vfx():
     # 3. Find ResourceResolver
     resource_resolver = None
     # Hashes for ResourceResolver (VfxResourceResolver)
-    rr_hashes = [
+    rr_hashes = frozenset((
         0x99566601, # ResourceResolver
         0xf24766db, # VfxResourceResolver 
         0x5f9a6e19  
-    ]
+    ))
     
-    # First, try to find by direct hash match
+    # Single pass: direct hash match first, resolve the name only on a miss
+    print(f"  Scanning {len(bin_file.entries)} entries...")
     for e in bin_file.entries:
-        if isinstance(e.type, int) and e.type in rr_hashes:
-            resource_resolver = e
-            # Resolve the type hash to a name for printing
-            type_hash_str = f"{e.type:08x}"
-            resolved_type = hashtables.get(type_hash_str, "Unknown")
-            print(f"  [FOUND] ResourceResolver (Type: {resolved_type} | Hash: {type_hash_str})")
-            break
-            
-    if not resource_resolver:
-        # 3. Find ResourceResolver by RESOLVING NAMES
-        print(f"  Scanning {len(bin_file.entries)} entries...")
-        
-        # We loop through ALL entries and check their resolved name
-        for e in bin_file.entries:
-            resolved_type = ""
-            type_hash_str = ""
-
-            # Handle STRING types (no format needed)
-            if isinstance(e.type, str):
-                 resolved_type = e.type
-                 type_hash_str = "String"
-            # Handle INT types (format as hex)
-            elif isinstance(e.type, int):
-                 type_hash_str = f"{e.type:08x}"
-                 resolved_type = hashtables.get(type_hash_str, "")
-            
-            # Check if this is the ResourceResolver
-            if "ResourceResolver" in resolved_type:
+        t = e.type
+        if isinstance(t, int):
+            type_hash_str = f"{t:08x}"
+            if t in rr_hashes:
                 resource_resolver = e
+                resolved_type = hashtables.get(type_hash_str, "Unknown")
                 print(f"  [FOUND] ResourceResolver (Type: {resolved_type} | Hash: {type_hash_str})")
                 break
+            resolved_type = hashtables.get(type_hash_str, "")
+        else:
+            # Handle STRING types (no format needed)
+            type_hash_str = "String"
+            resolved_type = t
+
+        # Check if this is the ResourceResolver
+        if "ResourceResolver" in resolved_type:
+            resource_resolver = e
+            print(f"  [FOUND] ResourceResolver (Type: {resolved_type} | Hash: {type_hash_str})")
+            break
             
     if not resource_resolver:
         print("  [Error] Could not find 'ResourceResolver' in BIN entries.")
@@ -126,7 +118,7 @@ def clean_unused_vfx():
             for key, value in field.data.items():
                 if isinstance(value, str):
                     # Store normalized path
-                    registered_vfx_paths.add(value.lower().replace('\\', '/'))
+                    registered_vfx_paths.add(normalize_path(value))
             break
             
     if not found_map:
@@ -140,51 +132,34 @@ def clean_unused_vfx():
     vfx_entries_count = 0
     kept_count = 0
     
+    # Classify each distinct entry type once (resolved name contains VfxSystemDefinitionData),
+    # so the per-entry check is a single set lookup
+    vfx_sys_types = {
+        t for t in {e.type for e in bin_file.entries}
+        if "VfxSystemDefinitionData" in (t if isinstance(t, str) else hashtables.get(f"{t:08x}", ""))
+    }
+    
     for e in bin_file.entries:
-        # Resolve entry type name
-        type_name = ""
-        type_hash_str = ""
-        
-        if isinstance(e.type, str):
-            type_name = e.type
-        elif isinstance(e.type, int):
-            type_hash_str = f"{e.type:08x}"
-            type_name = hashtables.get(type_hash_str, "")
-        
-        # Check if this is a VfxSystemDefinitionData
-        if "VfxSystemDefinitionData" in type_name:
-            vfx_entries_count += 1
-            
-            # Resolve Entry Hash -> Name (the system name)
-            resolved_name = ""
-            e_hash_val = e.hash
-            
-            if isinstance(e_hash_val, str):
-                resolved_name = e_hash_val
-            elif isinstance(e_hash_val, int):
-                e_hash_str = f"{e_hash_val:08x}"
-                resolved_name = hashtables.get(e_hash_str)
-            
-            is_used = False
-            if resolved_name:
-                clean_resolved = resolved_name.lower().replace('\\', '/')
-                if clean_resolved in registered_vfx_paths:
-                    is_used = True
-                    kept_count += 1
-                else:
-                    # Found name, but not in resolver list
-                    pass 
-            else:
-                # Hash unknown - treat as unused?
-                pass
+        if e.type not in vfx_sys_types:
+            continue
+        vfx_entries_count += 1
+
+        # Resolve Entry Hash -> Name (the system name); unknown hashes count as unused
+        e_hash_val = e.hash
+        if isinstance(e_hash_val, str):
+            resolved_name = e_hash_val
+        else:
+            resolved_name = hashtables.get(f"{e_hash_val:08x}")
 
-            if not is_used:
-                entries_to_remove.append(e)
+        if resolved_name and normalize_path(resolved_name) in registered_vfx_paths:
+            kept_count += 1
+        else:
+            entries_to_remove.append(e)
 
     if entries_to_remove:
         print(f"  Removing {len(entries_to_remove)} unused entries (Kept {kept_count}/{vfx_entries_count})")
-        for e in entries_to_remove:
-            bin_file.entries.remove(e)
+        remove_ids = set(map(id, entries_to_remove))
+        bin_file.entries = [e for e in bin_file.entries if id(e) not in remove_ids]
             
         bin_file.write(str(bin_path))
         print(f"\n✓ SUCCESS: Cleaned unused VFX systems from {bin_path.name}")
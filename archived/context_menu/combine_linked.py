@@ -2,6 +2,8 @@ import os
 import sys
 import re
 import json
+import operator
+import stat
 from pathlib import Path
 
 # Setup Project Paths
@@ -16,6 +18,7 @@ if str(current_dir) not in sys.path:
 try:
     import pyRitoFile
     from pyRitoFile.bin import BIN, BINHasher
+    from pyRitoFile.helper import normalize_path, find_skin_root
     try:
         from pyRitoFile.wad import WADHasher
     except ImportError:
@@ -25,22 +28,31 @@ except ImportError:
     print("Error: Could not import pyRitoFile.")
     sys.exit(1)
 
+# Faster JSON decoding for large hashed_files.json maps when orjson is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_CHAMP_RE = re.compile(r'/characters/([^/]+)/', re.IGNORECASE)
+
+def _is_regular(p):
+    """exists() + is_file() answered by a single stat() call."""
+    try:
+        return stat.S_ISREG(os.stat(p).st_mode)
+    except OSError:
+        return False
+
 def get_bin_entry_hashes(bin_obj):
     """Return a set of all entry hashes in a BIN."""
-    return {getattr(e, 'hash', '') for e in bin_obj.entries}
+    return set(map(operator.attrgetter('hash'), bin_obj.entries))
 
 def combine_linked():
     if len(sys.argv) < 2: return
     main_bin_path = Path(sys.argv[1]).absolute()
     
     # 1. Determine Skin Root (Parent of 'data')
-    root_dir = main_bin_path.parent
-    temp = main_bin_path.parent
-    while temp.parent != temp:
-        if temp.name.lower() == 'data':
-            root_dir = temp.parent
-            break
-        temp = temp.parent
+    root_dir = find_skin_root(main_bin_path)
 
     print(f"--- CONTENT-BASED MERGE ---")
     print(f"Main BIN: {main_bin_path.name}")
@@ -52,29 +64,26 @@ def combine_linked():
     
     # 3. Detect champ name to skip base bin
     champ_name = None
-    match = re.search(r'/characters/([^/]+)/', main_bin_path.as_posix(), re.IGNORECASE)
+    match = _CHAMP_RE.search(main_bin_path.as_posix())
     if match: champ_name = match.group(1).lower()
 
     merged_files = []
 
     # Load hashed_files.json from root_dir (maps hashed filename -> original path)
     # This is created during WAD extraction and tells us which hashed .bin files map to which paths
-    hashed_files_map = {}  # hashed_filename (without .bin) -> original_path
     path_to_hash = {}      # original_path -> hashed_filename (without .bin)
 
     hashed_json_path = root_dir / "hashed_files.json"
     if hashed_json_path.exists():
         try:
-            with open(hashed_json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                for hashed_name, orig_path in data.items():
-                    # hashed_name is like "38bfb361f6e60b7b.bin"
-                    # orig_path is like "data/akali_skins_skin0_skins_skin1_...bin"
-                    h = hashed_name.replace('.bin', '').lower()
-                    p = orig_path.lower().replace('\\', '/')
-                    hashed_files_map[h] = p
-                    path_to_hash[p] = h
-                print(f"  Loaded {len(data)} entries from hashed_files.json")
+            data = _json_loads(hashed_json_path.read_bytes())
+            # hashed_name is like "38bfb361f6e60b7b.bin"
+            # orig_path is like "data/akali_skins_skin0_skins_skin1_...bin"
+            path_to_hash = {
+                normalize_path(op): (hn[:-4] if hn.endswith('.bin') else hn).lower()
+                for hn, op in data.items()
+            }
+            print(f"  Loaded {len(data)} entries from hashed_files.json")
         except Exception as e:
             print(f"  Failed to load hashed_files.json: {e}")
     else:
@@ -86,12 +95,22 @@ def combine_linked():
     processed_paths = set()
     
     # Helper to check if a file is the base bin
+    base_bin_name = f"{champ_name}.bin" if champ_name else None
     def is_base_bin(p):
-        return champ_name and p.name.lower() == f"{champ_name}.bin"
+        return base_bin_name is not None and p.name.lower() == base_bin_name
+
+    # resolve() can hit the filesystem (symlinks), so resolve each path only once
+    resolved_cache = {}
+    def resolved(p):
+        r = resolved_cache.get(p)
+        if r is None:
+            r = resolved_cache[p] = p.resolve()
+        return r
 
     # Helper to check if file is main bin
+    main_bin_resolved = main_bin_path.resolve()
     def is_main_bin(p):
-        return p.resolve() == main_bin_path.resolve()
+        return resolved(p) == main_bin_resolved
 
     # 4a. Check explicitly linked files
     print(f"\n--- LINKED BINS ({len(main_bin.links)} links) ---")
@@ -101,7 +120,7 @@ def combine_linked():
             continue
 
         link_name = Path(link).name
-        normalized_link = link.lower().replace('\\', '/')
+        normalized_link = normalize_path(link)
 
         candidates = [
             (root_dir / link_name, "name"),
@@ -110,12 +129,12 @@ def combine_linked():
 
         # Try to find hash from loaded hashtables (reverse lookup)
         hashed_name = None
-        if normalized_link in path_to_hash:
-            hashed_name = path_to_hash[normalized_link] + ".bin"
+        known_hash = path_to_hash.get(normalized_link)
+        if known_hash is not None:
+            hashed_name = known_hash + ".bin"
             candidates.append((root_dir / hashed_name, "hash-lookup"))
-
-        # Fallback: compute hash if WADHasher available
-        if WADHasher and not hashed_name:
+        # Fallback: compute hash only if the lookup missed and WADHasher is available
+        elif WADHasher:
             hashed_name = WADHasher.raw_to_hex(normalized_link) + ".bin"
             candidates.append((root_dir / hashed_name, "hash-computed"))
 
@@ -125,12 +144,13 @@ def combine_linked():
 
         found = False
         for cand, method in candidates:
-            if cand.exists() and cand.is_file():
-                if cand.resolve() not in processed_paths:
+            if _is_regular(cand):
+                cand_resolved = resolved(cand)
+                if cand_resolved not in processed_paths:
                     if not is_base_bin(cand) and not is_main_bin(cand):
                         print(f"    -> Found via {method}: {cand.name}")
                         files_to_process.append((cand, link))
-                        processed_paths.add(cand.resolve())
+                        processed_paths.add(cand_resolved)
                         found = True
                     break
 
@@ -141,13 +161,18 @@ def combine_linked():
 
     for f, original_link in files_to_process:
         try:
+            # Cheap scan of the entry hashes first: skip the full parse
+            # when the bin has nothing we don't already have
+            if BIN.peek_entry_hashes(str(f)) <= main_entry_hashes:
+                continue
+
             # Open the bin
             mystery_bin = BIN().read(str(f))
             
             # Check if this bin has "new" entries we don't have yet
             new_entries = []
             for e in mystery_bin.entries:
-                h = getattr(e, 'hash', '')
+                h = e.hash
                 if h and h not in main_entry_hashes:
                     new_entries.append(e)
             
@@ -158,8 +183,7 @@ def combine_linked():
                 
                 main_bin.entries.extend(new_entries)
                 # Update our tracking set
-                for e in new_entries:
-                    main_entry_hashes.add(getattr(e, 'hash', ''))
+                main_entry_hashes.update(map(operator.attrgetter('hash'), new_entries))
                 
                 merged_files.append(f)
                 if original_link:
@@ -1,7 +1,10 @@
 import os
 import sys
 import re
+import struct
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 
 # Add project root to sys.path to import pyRitoFile
 # Since we are running from context_menu/python/python.exe, 
@@ -18,8 +21,41 @@ except ImportError as e:
     print(f"Error: Could not import pyRitoFile libraries. {e}")
     sys.exit(1)
 
+_CHAMP_SKIN_RE = re.compile(r'/characters/([^/]+)/skins/skin(\d+)', re.IGNORECASE)
+
+# Placeholder hashes written into the per-skin slots of the template serialization
+_SENTINELS = ('f00dface', 'f00dfacf', 'f00dfad0')
+
+def find_patch_offsets(data, sentinels):
+    """Byte offset of each u32 sentinel in data, or None if one is missing or not unique."""
+    offsets = []
+    for sentinel in sentinels:
+        needle = struct.pack('<I', int(sentinel, 16))
+        off = data.find(needle)
+        if off < 0 or data.find(needle, off + 1) >= 0:
+            return None
+        offsets.append(off)
+    return offsets
+
+def write_if_changed(path, data):
+    """Write data to path unless the file already holds exactly these bytes. Returns True if written."""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    # One write call into a sibling temp file, then an atomic swap so a crash
+    # never leaves a half-written skin bin behind
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
 def apply_noskin_lite(source_bin_path, champ_name, source_skin_idx=0, output_root=None):
-    if not os.path.exists(source_bin_path):
+    # One stat serves both the existence check and the size used below
+    try:
+        source_size = os.stat(source_bin_path).st_size
+    except OSError:
         print(f"Error: Source BIN not found: {source_bin_path}")
         return
 
@@ -61,41 +97,81 @@ def apply_noskin_lite(source_bin_path, champ_name, source_skin_idx=0, output_roo
     
     original_mrr_data = base_mrr_field.data if base_mrr_field else None
     
-    source_size = os.path.getsize(source_bin_path)
     source_dir = Path(source_bin_path).parent
 
-    for target_idx in range(0, 100):
-        # Skip the source file itself
-        if target_idx == source_skin_idx:
-            continue
+    # The only bytes that differ between skins are three u32 hashes (scdp entry hash,
+    # rr entry hash, mResourceResolver link). Serialize once with sentinels in those
+    # slots and byte-patch the copies; re-serialize only if the sentinels can't be located.
+    sentinels = _SENTINELS[:1 + bool(base_rr) + bool(base_mrr_field)]
+    base_scdp.hash = _SENTINELS[0]
+    if base_rr:
+        base_rr.hash = _SENTINELS[1]
+    if base_mrr_field:
+        base_mrr_field.data = _SENTINELS[2]
+    template = bin_file.write(None, raw=True) if output_root else None
+    patch_offsets = find_patch_offsets(template, sentinels) if template else None
+
+    # Serializing holds the GIL, so it stays on this thread; the file writes
+    # are independent (distinct skinN.bin) and get fanned out to the pool.
+    # Every queued write holds its own copy of the bin, so at most `window` are in flight
+    workers = os.cpu_count() or 1
+    window = 2 * workers
+    in_flight = deque()
+
+    def report(target_idx, future):
+        if future.result():
+            print(f"✓ Created/Updated skin{target_idx}.bin")
+        else:
+            print(f"  skin{target_idx}.bin already up to date")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for target_idx in range(0, 100):
+            # Skip the source file itself
+            if target_idx == source_skin_idx:
+                continue
             
-        out_path = source_dir / f'skin{target_idx}.bin'
+            out_path = source_dir / f'skin{target_idx}.bin'
         
-        # Safety skip: if sizes are DIFFERENT, it's likely a custom mod. 
-        # Only overwrite if sizes are IDENTICAL (meaning it was probably cloned by noskinlite before)
-        if out_path.exists():
-            if out_path.stat().st_size != source_size:
-                # print(f"  Skipping skin{target_idx}.bin (different size - custom mod protected)")
-                continue
+            # Safety skip: if sizes are DIFFERENT, it's likely a custom mod. 
+            # Only overwrite if sizes are IDENTICAL (meaning it was probably cloned by noskinlite before)
+            if out_path.exists():
+                if out_path.stat().st_size != source_size:
+                    # print(f"  Skipping skin{target_idx}.bin (different size - custom mod protected)")
+                    continue
 
-        # Update hashes in-place
-        new_scdp_path = f"characters/{champ}/skins/skin{target_idx}"
-        base_scdp.hash = BINHasher.raw_to_hex(new_scdp_path.lower())
-        
-        if base_rr:
+            # New hashes for this skin
+            new_scdp_path = f"characters/{champ}/skins/skin{target_idx}"
+            new_hashes = [BINHasher.raw_to_hex(new_scdp_path.lower())]
             # The link path format (what mResourceResolver points to)
             new_rr_link = f"Characters/{champ}/Skins/Skin{target_idx}/Resources"
-            # The entry hash is the hash of the lowercase path
-            new_rr_hash = BINHasher.raw_to_hex(new_rr_link.lower())
-            base_rr.hash = new_rr_hash
+            if base_rr:
+                # The entry hash is the hash of the lowercase path
+                new_hashes.append(BINHasher.raw_to_hex(new_rr_link.lower()))
             if base_mrr_field:
-                # mResourceResolver is a LINK field - it needs the path string, not hash
-                base_mrr_field.data = new_rr_link
+                # mResourceResolver is a LINK field, stored as the hash of the path string
+                new_hashes.append(BINHasher.raw_to_hex(new_rr_link))
         
-        # Write the bin with modified hashes
-        if output_root:
-            bin_file.write(str(out_path))
-            print(f"✓ Created/Updated skin{target_idx}.bin")
+            if not output_root:
+                continue
+
+            if patch_offsets is not None:
+                data = bytearray(template)
+                for off, new_hash in zip(patch_offsets, new_hashes):
+                    struct.pack_into('<I', data, off, int(new_hash, 16))
+            else:
+                # Fallback: update hashes in-place and serialize the whole tree
+                base_scdp.hash = new_hashes[0]
+                if base_rr:
+                    base_rr.hash = new_hashes[1]
+                    if base_mrr_field:
+                        base_mrr_field.data = new_rr_link
+                data = bin_file.write(None, raw=True)
+            in_flight.append((target_idx, pool.submit(write_if_changed, out_path, data)))
+            if len(in_flight) >= window:
+                report(*in_flight.popleft())
+
+        while in_flight:
+            report(*in_flight.popleft())
     
     # Restore original hashes (optional, for cleanliness)
     base_scdp.hash = original_scdp_hash
@@ -113,7 +189,7 @@ if __name__ == "__main__":
     
     # Try to detect champ and skin from path
     normalized_path = target_bin.replace('\\', '/')
-    match = re.search(r'/characters/([^/]+)/skins/skin(\d+)', normalized_path, re.IGNORECASE)
+    match = _CHAMP_SKIN_RE.search(normalized_path)
     
     if match:
         champ_name = match.group(1)
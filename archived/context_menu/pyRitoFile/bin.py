@@ -2,6 +2,8 @@ from .stream import BytesStream
 from .helper import FNV1a
 from .wad import WADHasher
 from enum import Enum
+from functools import lru_cache
+import mmap
 
 class BINType(Enum):
     # basic
@@ -63,6 +65,7 @@ class BINHasher:
         return hex
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def raw_to_hex(raw):
         return f'{FNV1a(raw):08x}'
 
@@ -441,6 +444,9 @@ class BINEntry:
                 res.append(item)
         return res
 
+class BINParseError(Exception):
+    pass
+
 class BIN:
     __slots__ = (
         'signature', 'version', 'is_patch',
@@ -459,27 +465,11 @@ class BIN:
         return {key: getattr(self, key) for key in self.__slots__}
 
     def read(self, path, raw=False):
+        # raw bytes would be dumped whole into the message, name them instead
+        name = '<bytes>' if raw else path
         with BytesStream.reader(path, raw) as bs:
-            # header
-            self.signature, = bs.read_s(4, encoding='utf-8')
-            if self.signature not in ('PROP', 'PTCH'):
-                raise Exception(
-                    f'pyRitoFile: Error: Read BIN {path}: Wrong file signature: {self.signature}')
-            if self.signature == 'PTCH':
-                self.is_patch = True
-                bs.pad(8)  # patch header
-                magic, = bs.read_s(4, encoding='utf-8')
-                if magic != 'PROP':
-                    raise Exception(
-                        f'pyRitoFile: Error: Read BIN {path}: Missing PROP after PTCH signature.')
-            self.version, = bs.read_u32()
-            if self.version not in (1, 2, 3):
-                raise Exception(
-                    f'pyRitoFile: Error: Read BIN {path}: Unsupported file version: {self.version}')
-            # links
-            if self.version >= 2:
-                link_count, = bs.read_u32()
-                self.links = [bs.read_s_sized16(encoding='utf-8')[0] for _ in range(link_count)]
+            # header + links
+            self.signature, self.is_patch, self.version, self.links = BIN._read_header(bs, name)
             # entry_types + entries
             entry_count, = bs.read_u32()
             entry_types = bs.read_u32(entry_count)
@@ -523,6 +513,62 @@ class BIN:
 
             return self
         
+    @staticmethod
+    def _read_header(bs, name, read_links=True):
+        # validate signature/version, leaves stream at entry_count
+        # returns (signature, is_patch, version, links); links are skipped when not read
+        signature, = bs.read_s(4, encoding='utf-8')
+        if signature not in ('PROP', 'PTCH'):
+            raise BINParseError(
+                f'pyRitoFile: Error: Read BIN {name}: Wrong file signature: {signature}')
+        is_patch = signature == 'PTCH'
+        if is_patch:
+            bs.pad(8)  # patch header
+            magic, = bs.read_s(4, encoding='utf-8')
+            if magic != 'PROP':
+                raise BINParseError(
+                    f'pyRitoFile: Error: Read BIN {name}: Missing PROP after PTCH signature.')
+        version, = bs.read_u32()
+        if version not in (1, 2, 3):
+            raise BINParseError(
+                f'pyRitoFile: Error: Read BIN {name}: Unsupported file version: {version}')
+        links = None
+        if version >= 2:
+            link_count, = bs.read_u32()
+            if read_links:
+                links = [bs.read_s_sized16(encoding='utf-8')[0] for _ in range(link_count)]
+            else:
+                for _ in range(link_count):
+                    bs.pad(bs.read_u16()[0])
+        return signature, is_patch, version, links
+
+    @staticmethod
+    def peek_entry_hashes(path, raw=False):
+        # read only the entry hashes, every entry body is skipped using its size
+        with BytesStream.reader(path, raw) as bs:
+            BIN._read_header(bs, '<bytes>' if raw else path, read_links=False)
+            entry_count, = bs.read_u32()
+            bs.pad(entry_count * 4)  # entry_types
+            entry_hashes = set()
+            for _ in range(entry_count):
+                size, entry_hash = bs.read_u32(2)
+                entry_hashes.add(BINHasher.hash_to_hex(entry_hash))
+                bs.pad(size - 4)
+            return entry_hashes
+
+    @staticmethod
+    def peek_types(path, raw=False):
+        # entry types sit contiguously right after the links, map the file and read only that table
+        if raw:
+            bs = BytesStream.reader(path, raw)
+        else:
+            with open(path, 'rb') as f:
+                bs = BytesStream(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        with bs:
+            BIN._read_header(bs, '<bytes>' if raw else path, read_links=False)
+            entry_count, = bs.read_u32()
+            return {BINHasher.hash_to_hex(t) for t in bs.read_u32(entry_count)}
+
     def write(self, path, raw=False):
         with BytesStream.writer(path, raw) as bs:
             # header
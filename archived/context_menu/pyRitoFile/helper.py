@@ -1,3 +1,5 @@
+from pathlib import Path
+
 
 def Elf(s):
     h = 0
@@ -20,5 +22,20 @@ def FNV1(s):
 def FNV1a(s):
     h = 0x811c9dc5
     for b in s.encode('ascii').lower():
-        h = ((h ^ b) * 0x01000193) % 0x100000000
+        # mask instead of modulo, same 32-bit result
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
     return h
+
+
+# Lowercase ASCII + backslash -> slash in a single str.translate pass
+_PATH_NORM = str.maketrans({**{chr(c): chr(c + 32) for c in range(65, 91)}, '\\': '/'})
+
+def normalize_path(s):
+    return s.translate(_PATH_NORM)
+
+
+def find_skin_root(bin_path):
+    # innermost 'data' directory above the bin; parts[0] is the anchor
+    parts = bin_path.parent.parts
+    data_idx = next((i for i in range(len(parts) - 1, 0, -1) if parts[i].lower() == 'data'), None)
+    return Path(*parts[:data_idx]) if data_idx is not None else bin_path.parent
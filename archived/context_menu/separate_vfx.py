@@ -1,33 +1,85 @@
 import os
 import sys
 import re
+import operator
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from collections import deque
 
-# Setup Project Paths
-current_dir = Path(__file__).parent.absolute()
-project_root = current_dir.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(current_dir))
+# The bundled interpreter doesn't put the script directory on sys.path; pyRitoFile
+# lives next to this file (worker processes inherit this path too)
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-try:
-    import pyRitoFile
-    from pyRitoFile.bin import BIN, BINHasher
-except ImportError:
-    print("Error: Could not import pyRitoFile.")
-    sys.exit(1)
+def _bounded_submit(ex, fn, items, window, *args):
+    """
+    Producer side of the scan pipeline: submit fn(item, *args) for each item, keeping
+    at most `window` tasks in flight. Yields (item, future) in input order.
+    """
+    pending = deque()
+    for item in items:
+        pending.append((item, ex.submit(fn, item, *args)))
+        if len(pending) >= window:
+            yield pending.popleft()
+    while pending:
+        yield pending.popleft()
+
+def _slurp_bins(paths):
+    """Read files on a small thread pool; yields (path, bytes or None, OSError or None) in input order."""
+    k = min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=k) as ex:
+        # Bounded at 2*k reads ahead of the consumer to cap memory
+        for p, fut in _bounded_submit(ex, Path.read_bytes, paths, 2 * k):
+            try:
+                yield p, fut.result(), None
+            except OSError as e:
+                yield p, None, e
+
+def _scan_one(path, types_map, raw=None):
+    """
+    Parse one bin and split its entries into (vfx, non_vfx).
+    Top-level so it can run in a worker process; returns (path, bin or None, vfx, non_vfx, skip reason or None).
+    """
+    from pyRitoFile.bin import BIN
+    try:
+        # Type table only: bins without any VFX system skip the full parse
+        if raw is not None:
+            types = BIN.peek_types(raw, raw=True)
+        else:
+            types = BIN.peek_types(path)
+        if types_map.keys().isdisjoint(types):
+            return path, None, [], [], None
+        b = BIN().read(raw, raw=True) if raw is not None else BIN().read(path)
+    except Exception as e:
+        # Unreadable or malformed bin, skip it. pyRitoFile can fail on corrupt data with
+        # any exception type, and aborting here would strand the VFX already stripped
+        # from earlier bins without ever writing the vfx bin.
+        # Reported by the parent so the line can't interleave with its output
+        return path, None, [], [], str(e)
+    vfx = []
+    non_vfx = []
+    get_category = types_map.get
+    vfx_append = vfx.append
+    non_vfx_append = non_vfx.append
+    for e in b.entries:
+        if get_category(e.type) == 'vfx':
+            vfx_append(e)
+        else:
+            non_vfx_append(e)
+    return path, b, vfx, non_vfx, None
 
 def separate_vfx():
     if len(sys.argv) < 2: return
+    # Imported here so a launch that bails out early never pays for loading pyRitoFile
+    try:
+        from pyRitoFile.bin import BIN, BINHasher
+        from pyRitoFile.helper import find_skin_root
+    except ImportError:
+        print("Error: Could not import pyRitoFile.")
+        sys.exit(1)
     main_bin_path = Path(sys.argv[1]).absolute()
     
     # 1. Determine Skin Root
-    root_dir = main_bin_path.parent
-    temp = main_bin_path.parent
-    while temp.parent != temp:
-        if temp.name.lower() == 'data':
-            root_dir = temp.parent
-            break
-        temp = temp.parent
+    root_dir = find_skin_root(main_bin_path)
 
     print(f"--- CONTENT-BASED VFX SEPARATION ---")
 
@@ -35,42 +87,96 @@ def separate_vfx():
     vfx_type_str = BINHasher.raw_to_hex('VfxSystemDefinitionData')
     vfx_type_int = int(vfx_type_str, 16)
     print(f"  VFX Type Hash: {vfx_type_str} (int: {vfx_type_int})")
+    # Entry type -> category; new categories only need an entry here
+    types_map = {vfx_type_int: 'vfx', vfx_type_str: 'vfx'}
 
     all_vfx_entries = []
     managed_hashes = set()
     
     # List of files to scan (Main bin + all bins in root)
+    # (deduplicated, so the main bin is never scanned twice when it lives in root)
     files_to_scan = [main_bin_path]
-    files_to_scan.extend(list(root_dir.glob("*.bin")))
+    seen_paths = {main_bin_path.resolve()}
+    with os.scandir(root_dir) as it:
+        for de in it:
+            if de.name.lower().endswith('.bin') and de.is_file():
+                p = Path(de.path).resolve()
+                if p not in seen_paths:
+                    seen_paths.add(p)
+                    files_to_scan.append(p)
     
     bins_changed = []
 
-    for f_path in files_to_scan:
-        try:
-            b = BIN().read(str(f_path))
-            non_vfx = []
-            extracted_count = 0
-            
-            for e in b.entries:
-                # Compare as int or string
-                is_vfx = (e.type == vfx_type_int) or (e.type == vfx_type_str)
-                if is_vfx:
-                    h = getattr(e, 'hash', '')
+    # Windows caps ProcessPoolExecutor at 61 workers
+    workers = min(os.cpu_count() or 1, 61)
+    if workers > 1 and len(files_to_scan) >= 4:
+        # Parse bins on all cores; dedup and write-back stay on this process
+        pool = ProcessPoolExecutor(max_workers=workers)
+        scanned = (fut.result() for _, fut in _bounded_submit(pool, _scan_one, files_to_scan, 2 * workers, types_map))
+    else:
+        # Trivial input or a single core: skip pool startup, reads still overlap with parsing
+        pool = None
+        # Unreadable files come through as a skip reason, same as a parse failure
+        scanned = (
+            _scan_one(p, types_map, raw) if err is None else (p, None, [], [], str(err))
+            for p, raw, err in _slurp_bins(files_to_scan)
+        )
+
+    # The main bin is parsed by the scan anyway; keep it so its VFX removal and
+    # the new link go out in a single write at the end
+    main_bin = None
+    main_bin_dirty = False
+
+    get_hash = operator.attrgetter('hash')
+    managed_hashes_add = managed_hashes.add
+    all_vfx_entries_append = all_vfx_entries.append
+    # Write-backs run on a few threads so dedup of the next bin overlaps the write
+    writer = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    write_backs = []
+    try:
+        for f_path, b, vfx, non_vfx, skip_reason in scanned:
+            if skip_reason is not None:
+                print(f"  [SKIP] {f_path.name}: {skip_reason}")
+            if b is None:
+                continue
+            is_main = main_bin is None and f_path == main_bin_path
+            if is_main:
+                main_bin = b
+            hashes = list(map(get_hash, vfx))
+            new_hashes = set(hashes)
+            if len(new_hashes) == len(hashes) and managed_hashes.isdisjoint(new_hashes):
+                # Common case: nothing seen before and no repeats in this file,
+                # take the whole batch with C-level set/list operations
+                all_vfx_entries.extend(vfx)
+                managed_hashes.update(new_hashes)
+                extracted_count = len(vfx)
+            else:
+                extracted_count = 0
+                for e, h in zip(vfx, hashes):
                     if h not in managed_hashes:
-                        all_vfx_entries.append(e)
-                        managed_hashes.add(h)
+                        all_vfx_entries_append(e)
+                        managed_hashes_add(h)
                         extracted_count += 1
-                else:
-                    non_vfx.append(e)
             
             if extracted_count > 0:
                 print(f"  [EXTRACT] {extracted_count} VFX from {f_path.name}")
                 b.entries = non_vfx
+                if is_main:
+                    main_bin_dirty = True
+                    continue
                 # We save it back (emptying the file of VFX)
-                b.write(str(f_path))
-                bins_changed.append(f_path)
-        except:
-            continue
+                write_backs.append((f_path, writer.submit(b.write, f_path)))
+        for f_path, fut in write_backs:
+            try:
+                fut.result()
+            except Exception as e:
+                print(f"  [SKIP] {f_path.name}: {e}")
+                continue
+            bins_changed.append(f_path)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        writer.shutdown()
 
     if not all_vfx_entries:
         print("No VFX systems found in any bin.")
@@ -82,14 +188,22 @@ def separate_vfx():
     vfx_path.parent.mkdir(parents=True, exist_ok=True)
     
     vfx_bin = BIN(signature='PROP', version=3, is_patch=False, links=[], entries=all_vfx_entries, patches=[])
-    vfx_bin.write(str(vfx_path))
-    
-    # Update main bin with the link
-    main_bin = BIN().read(str(main_bin_path))
-    link_str = f"data/{vfx_name}"
-    if link_str not in main_bin.links:
-        main_bin.links.append(link_str)
-    main_bin.write(str(main_bin_path))
+    # The two final writes are independent; run them side by side
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        vfx_write = ex.submit(vfx_bin.write, vfx_path)
+        
+        # Update main bin with the link
+        if main_bin is None:
+            main_bin = BIN().read(main_bin_path)
+        link_str = f"data/{vfx_name}"
+        if link_str not in main_bin.links:
+            main_bin.links.append(link_str)
+            main_bin_dirty = True
+        if main_bin_dirty:
+            ex.submit(main_bin.write, main_bin_path).result()
+            if main_bin_path not in bins_changed:
+                bins_changed.append(main_bin_path)
+        vfx_write.result()
     
     print(f"\n[OK] SUCCESS: Created data/{vfx_name} with {len(all_vfx_entries)} systems.")
 
@@ -243,7 +243,8 @@ fn tex_to_dds_bytes(src: &Path, bytes: &[u8]) -> Result<Vec<u8>, String> {
     let tex_format = r.read_u8().map_err(|e| e.to_string())?;
     let _resource_type = r.read_u8().map_err(|e| e.to_string())?;
     let flags = r.read_u8().map_err(|e| e.to_string())?;
-    let data = bytes[12..].to_vec();
+    // Borrow the payload; mip blocks are slices into it and get copied exactly once, into `out`.
+    let data = &bytes[12..];
 
     let (fmt, pf_flags, fourcc, rgb_bits, rmask, gmask, bmask, amask) = match tex_format {
         TEX_FMT_BC1 => (FormatKind::Bc1, 0x0000_0004u32, FOURCC_DXT1, 0, 0, 0, 0, 0),
@@ -264,7 +265,7 @@ fn tex_to_dds_bytes(src: &Path, bytes: &[u8]) -> Result<Vec<u8>, String> {
     let has_mips = (flags & TEX_FLAG_HAS_MIPS) != 0;
     let mip_cnt = if has_mips { mip_count(width, height) } else { 1 };
 
-    let blocks_small_to_large = if has_mips {
+    let blocks_small_to_large: Vec<&[u8]> = if has_mips {
         let mut off = 0usize;
         let mut blocks = Vec::with_capacity(mip_cnt as usize);
         for level in (0..mip_cnt).rev() {
@@ -272,7 +273,7 @@ fn tex_to_dds_bytes(src: &Path, bytes: &[u8]) -> Result<Vec<u8>, String> {
             if off + sz > data.len() {
                 return Err(format!("TEX mip data truncated in {}", src.display()));
             }
-            blocks.push(data[off..off + sz].to_vec());
+            blocks.push(&data[off..off + sz]);
             off += sz;
         }
         blocks
@@ -280,7 +281,7 @@ fn tex_to_dds_bytes(src: &Path, bytes: &[u8]) -> Result<Vec<u8>, String> {
         vec![data]
     };
 
-    let mut out = Vec::new();
+    let mut out = Vec::with_capacity(128 + data.len());
     out.write_u32::<LittleEndian>(DDS_MAGIC).map_err(|e| e.to_string())?;
     out.write_u32::<LittleEndian>(124).map_err(|e| e.to_string())?;
     let mut dw_flags = 0x0000_1007u32;
@@ -224,6 +224,19 @@ async function discoverMaterialTextureHints({
     map.set(refNoInst, texturePath);
     map.set(normalizeSimple(refNoInst), texturePath);
   };
+  // The same texture paths recur across materials, overrides and the join passes;
+  // validate each distinct path once. Value is the lowercased ref, or null if rejected.
+  const textureRefCache = new Map();
+  const acceptTexturePath = (texturePath) => {
+    let ref = textureRefCache.get(texturePath);
+    if (ref === undefined) {
+      ref = looksLikeTexturePath(texturePath) && textureMatchesSelectedCharacter(texturePath)
+        ? texturePath.toLowerCase()
+        : null;
+      textureRefCache.set(texturePath, ref);
+    }
+    return ref;
+  };
 
   const submeshToMaterial = new Map();
   const submeshToTexture = new Map();
@@ -251,10 +264,11 @@ async function discoverMaterialTextureHints({
     }
     // Some overrides specify texture directly instead of a Material link.
     const texturePath = readStringLike(textureField).replace(/\\/g, '/');
-    if (looksLikeTexturePath(texturePath) && textureMatchesSelectedCharacter(texturePath)) {
+    const textureRef = acceptTexturePath(texturePath);
+    if (textureRef) {
       submeshToTexture.set(normalizeSimple(submeshName), texturePath);
       hints[normalizeSimple(submeshName)] = texturePath;
-      discoveredTextureRefs.add(texturePath.toLowerCase());
+      discoveredTextureRefs.add(textureRef);
     }
   };
   const scanForMaterialOverrides = (field) => {
@@ -416,9 +430,9 @@ async function discoverMaterialTextureHints({
               const textureName = readStringLike(textureNameField);
               if (!normalizeKey(textureName).includes('diffuse_texture')) continue;
               const texturePath = readStringLike(texturePathField).replace(/\\/g, '/');
-              if (!looksLikeTexturePath(texturePath)) continue;
-              if (!textureMatchesSelectedCharacter(texturePath)) continue;
-              discoveredTextureRefs.add(texturePath.toLowerCase());
+              const textureRef = acceptTexturePath(texturePath);
+              if (!textureRef) continue;
+              discoveredTextureRefs.add(textureRef);
               addMaterialAlias(materialToTexture, materialRefName, texturePath);
               // Also index by static material entry hash so Material: link = 0x... overrides resolve.
               if (entryHashRaw) {
@@ -440,7 +454,7 @@ async function discoverMaterialTextureHints({
     const explicitTexture = submeshToTexture.get(submeshKey);
     const texturePath = explicitTexture || resolveTextureByMaterialRef(materialRef);
 
-    if (texturePath && looksLikeTexturePath(texturePath) && textureMatchesSelectedCharacter(texturePath)) {
+    if (texturePath && acceptTexturePath(texturePath)) {
       hints[submeshKey] = texturePath;
     }
   }
@@ -453,7 +467,7 @@ async function discoverMaterialTextureHints({
     const fromMaterial = resolveTextureByMaterialRef(candidate.materialRef);
     const fromTexture = candidate.texturePath || '';
     const resolved = (fromMaterial && looksLikeTexturePath(fromMaterial)) ? fromMaterial : fromTexture;
-    if (!resolved || !looksLikeTexturePath(resolved) || !textureMatchesSelectedCharacter(resolved)) continue;
+    if (!resolved || !acceptTexturePath(resolved)) continue;
 
     const simpleSkinKey = normalizeKey(candidate.simpleSkinPath || '');
     if (simpleSkinKey && !defaultTextureBySkn[simpleSkinKey]) {
@@ -463,7 +477,7 @@ async function discoverMaterialTextureHints({
   }
   if (defaultTextureHint) {
     hints.__default__ = defaultTextureHint;
-    discoveredTextureRefs.add(defaultTextureHint.toLowerCase());
+    discoveredTextureRefs.add(acceptTexturePath(defaultTextureHint));
   }
 
   return {
@@ -335,7 +335,8 @@ export function parseVfxFile(content) {
 
     // === STATIC MATERIALS PARSING ===
     if (hasStaticMaterials(content)) {
-        const materialsResult = parseStaticMaterials(content);
+        // Hand over the lines already split above instead of splitting the file again
+        const materialsResult = parseStaticMaterials(content, lines);
         
         // Copy materials data to result (reuse same lines array)
         result.materials = materialsResult.materials;
@@ -5,6 +5,16 @@
  * using semantic analysis (suffix patterns + blacklist + value validation)
  */
 
+// Control parameter suffixes that are NOT colors. Shared by every isColorParameter call
+// instead of being rebuilt per param ('_strength' etc. already end with 'strength')
+const CONTROL_SUFFIXES = Object.freeze([
+    'strength', 'factor', 'power', 'control', 
+    'speed', 'tile', 'modifier', 'input', 
+    'activation', 'minmax', 'mask', 'scale', 
+    'mult', 'offset', 'range', 'threshold',
+    'intensity', 'amount', 'rate', 'size'
+]);
+
 /**
  * Determine if a parameter is a color parameter
  * Uses semantic suffix matching, blacklist, and value validation
@@ -28,17 +38,7 @@ export function isColorParameter(paramName, values) {
     const isFgBgColor = /^(fg|bg)color$/i.test(paramName);
     
     // 4. BLACKLIST - Control parameter suffixes that are NOT colors
-    const controlSuffixes = [
-        'strength', 'factor', 'power', 'control', 
-        'speed', 'tile', 'modifier', 'input', 
-        'activation', 'minmax', 'mask', 'scale', 
-        'mult', 'offset', 'range', 'threshold',
-        'intensity', 'amount', 'rate', 'size'
-    ];
-    
-    const isControlParam = controlSuffixes.some(suffix => 
-        name.endsWith(suffix) || name.endsWith('_' + suffix)
-    );
+    const isControlParam = CONTROL_SUFFIXES.some(suffix => name.endsWith(suffix));
     
     // 5. VALUE SANITY CHECK - Control params often have:
     //    - Values significantly > 1 (shader multipliers)
@@ -78,11 +78,10 @@ export function isColorParameter(paramName, values) {
  * Parse StaticMaterialDef structures from .py content
  * 
  * @param {string} content - Full file content
+ * @param {string[]} [lines] - content already split on '\n' (skips a second split)
  * @returns {Object} { materials: Map, materialOrder: [], stats: {} }
  */
-export function parseStaticMaterials(content) {
-    const lines = content.split('\n');
-    
+export function parseStaticMaterials(content, lines = content.split('\n')) {
     const result = {
         lines,
         materials: new Map(),    // materialKey -> { name, colorParams: [], lineStart, lineEnd }
@@ -98,6 +97,7 @@ export function parseStaticMaterials(content) {
     let bracketDepth = 0;
     let materialBracketDepth = 0;
     let paramBracketDepth = 0;
+    const vec4Pool = new Map();  // vec4 literal text -> parsed [r, g, b, a] (null if malformed)
     
     for (let i = 0; i < lines.length; i++) {
         const line = lines[i];
@@ -159,9 +159,16 @@ export function parseStaticMaterials(content) {
             // Parameter value (vec4)
             const valueMatch = trimmed.match(/^[Vv]alue:\s*vec4\s*=\s*\{\s*([^}]+)\}/i);
             if (valueMatch) {
-                const vals = valueMatch[1].split(',').map(v => parseFloat(v.trim()));
-                if (vals.length >= 4 && vals.every(n => !isNaN(n))) {
-                    currentParam.values = vals.slice(0, 4);
+                // Same literal recurs across materials (ToonShadePower, TintColorRim...),
+                // parse it once and share the array. Edits replace param.values, never write into it
+                let vals = vec4Pool.get(valueMatch[1]);
+                if (vals === undefined) {
+                    const parsed = valueMatch[1].split(',').map(v => parseFloat(v.trim()));
+                    vals = parsed.length >= 4 && parsed.every(n => !isNaN(n)) ? parsed.slice(0, 4) : null;
+                    vec4Pool.set(valueMatch[1], vals);
+                }
+                if (vals) {
+                    currentParam.values = vals;
                     currentParam.valueLine = i;
                 }
             }